@@ -0,0 +1,65 @@
+"""
+Benchmark for lazy_worklog_tracker.analytics over generated worklogs.
+
+Usage:
+    python benchmarks/analytics_benchmark.py [rows]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Iterable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from abstract.interfaces import WorklogEntity, WorklogsRepository  # noqa: E402
+from lazy_worklog_tracker import analytics  # noqa: E402
+
+
+class InMemoryWorklogsRepository(WorklogsRepository):
+    def __init__(self, worklogs: List[WorklogEntity]) -> None:
+        self._worklogs = worklogs
+
+    def get_worklogs(
+        self, dates: Iterable[str], tasks: Iterable[str]
+    ) -> Iterable[WorklogEntity]:
+        return self._worklogs
+
+
+def generate(rows: int) -> List[WorklogEntity]:
+    rnd = random.Random(42)
+    start = date(2020, 1, 1)
+    days = [(start + timedelta(days=i)).isoformat() for i in range(2000)]
+    tasks = [f"TASK-{i}" for i in range(200)]
+    durations = [analytics.format_minutes(m) for m in range(15, 6 * 60, 15)]
+    return [
+        WorklogEntity(i, rnd.choice(days), rnd.choice(tasks), rnd.choice(durations))
+        for i in range(rows)
+    ]
+
+
+def measure(name: str, func):
+    started = time.perf_counter()
+    result = func()
+    print(f"{name:<24}{time.perf_counter() - started:8.3f}s")
+    return result
+
+
+def main(rows: int) -> None:
+    backend = "numpy" if analytics.np is not None else "array"
+    print(f"rows: {rows}, backend: {backend}")
+    repository = InMemoryWorklogsRepository(generate(rows))
+    columns = measure(
+        "load_columns", lambda: analytics.load_columns(repository, [], [])
+    )
+    measure("minutes_per_weekday", lambda: analytics.minutes_per_weekday(columns))
+    measure("minutes_per_day", lambda: analytics.minutes_per_day(columns))
+    measure("rolling_weekly_totals", lambda: analytics.rolling_weekly_totals(columns))
+    measure("task_percentiles", lambda: analytics.task_percentiles(columns))
+    measure("overtime_days", lambda: analytics.overtime_days(columns))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import re
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from abstract.interfaces import WorklogEntity, WorklogsRepository
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, fall back to stdlib arrays
+    np = None
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+WORKDAY_MINUTES = 8 * 60
+TOP_TASKS = 10
+# a worklog can't be longer than a day, keeps every sum far below 2**53
+MAX_DURATION_MINUTES = 24 * 60
+
+_DURATION_PATTERN = re.compile(r"^\s*(?:(\d{1,4})\s*[hH])?\s*(?:(\d{1,4})\s*[mM])?\s*$")
+
+
+def parse_duration(duration: str) -> int | None:
+    """
+    Converts duration like 2H30M, 3h or 45m to minutes.
+    Unknown formats and durations longer than a day give None.
+    """
+    match = _DURATION_PATTERN.match(duration or "")
+    if match is None:
+        return None
+    hours, minutes = match.groups()
+    if hours is None and minutes is None:
+        return None
+    total = int(hours or 0) * 60 + int(minutes or 0)
+    if total > MAX_DURATION_MINUTES:
+        return None
+    return total
+
+
+def format_minutes(minutes: int) -> str:
+    hours, rest = divmod(int(minutes), 60)
+    if hours and rest:
+        return f"{hours}H{rest}M"
+    if hours:
+        return f"{hours}H"
+    return f"{rest}M"
+
+
+@dataclass
+class WorklogColumns:
+    """
+    Columnar view of worklogs.
+
+    Attributes:
+        dates: proleptic gregorian ordinals (date.toordinal)
+        tasks: index into task_names
+        minutes: duration in minutes
+        task_names: distinct task names in order of first appearance
+        skipped: worklogs left out because of unparseable date or duration
+    """
+
+    dates: Sequence[int]
+    tasks: Sequence[int]
+    minutes: Sequence[int]
+    task_names: List[str]
+    skipped: int = 0
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+
+def _new_column(values) -> Sequence[int]:
+    if np is not None:
+        return np.asarray(values, dtype=np.int64)
+    return array("q", values)
+
+
+def columns_from_worklogs(worklogs: Iterable[WorklogEntity]) -> WorklogColumns:
+    dates = array("q")
+    tasks = array("q")
+    minutes = array("q")
+    task_codes: Dict[str, int] = {}
+    ordinals: Dict[str, int] = {}
+    skipped = 0
+    for worklog in worklogs:
+        ordinal = ordinals.get(worklog.date)
+        if ordinal is None:
+            try:
+                ordinal = date.fromisoformat(worklog.date).toordinal()
+            except (TypeError, ValueError):
+                skipped += 1
+                continue
+            ordinals[worklog.date] = ordinal
+        try:
+            duration = parse_duration(worklog.duration)
+        except TypeError:
+            duration = None
+        if duration is None:
+            skipped += 1
+            continue
+        dates.append(ordinal)
+        tasks.append(task_codes.setdefault(worklog.task, len(task_codes)))
+        minutes.append(duration)
+    return WorklogColumns(
+        _new_column(dates),
+        _new_column(tasks),
+        _new_column(minutes),
+        list(task_codes),
+        skipped,
+    )
+
+
+def load_columns(
+    repository: WorklogsRepository, dates: Iterable[str], tasks: Iterable[str]
+) -> WorklogColumns:
+    return columns_from_worklogs(repository.get_worklogs(dates, tasks))
+
+
+def minutes_per_weekday(columns: WorklogColumns) -> List[int]:
+    """Total minutes for every weekday, Monday first"""
+    if np is not None:
+        # date.fromordinal(1) is a Monday
+        weekdays = (np.asarray(columns.dates) - 1) % 7
+        # float64 weight sums are exact, minutes are bounded by MAX_DURATION_MINUTES
+        totals = np.bincount(weekdays, weights=columns.minutes, minlength=7)
+        return [int(x) for x in totals]
+    totals = [0] * 7
+    for ordinal, minutes in zip(columns.dates, columns.minutes):
+        totals[(ordinal - 1) % 7] += minutes
+    return totals
+
+
+def minutes_per_day(columns: WorklogColumns) -> List[Tuple[int, int]]:
+    """(date ordinal, total minutes) for every date with worklogs, sorted by date"""
+    if np is not None:
+        days, inverse = np.unique(np.asarray(columns.dates), return_inverse=True)
+        totals = np.bincount(inverse, weights=columns.minutes, minlength=len(days))
+        return [(int(d), int(t)) for d, t in zip(days, totals)]
+    totals: Dict[int, int] = {}
+    for ordinal, minutes in zip(columns.dates, columns.minutes):
+        totals[ordinal] = totals.get(ordinal, 0) + minutes
+    return sorted(totals.items())
+
+
+def minutes_per_task(columns: WorklogColumns) -> List[Tuple[str, int]]:
+    """(task name, total minutes) for every task, most logged first"""
+    if np is not None:
+        totals = np.bincount(
+            np.asarray(columns.tasks),
+            weights=columns.minutes,
+            minlength=len(columns.task_names),
+        )
+        result = [(columns.task_names[i], int(t)) for i, t in enumerate(totals)]
+    else:
+        sums = [0] * len(columns.task_names)
+        for code, minutes in zip(columns.tasks, columns.minutes):
+            sums[code] += minutes
+        result = list(zip(columns.task_names, sums))
+    # stable sort keeps first appearance order for equal totals
+    return sorted(result, key=lambda x: -x[1])
+
+
+def rolling_weekly_totals(
+    columns: WorklogColumns, window: int = 7
+) -> List[Tuple[int, int]]:
+    """
+    Sum of minutes over the last `window` calendar days, ending at every date with worklogs.
+
+    Returns:
+        list: (date ordinal, total minutes) sorted by date
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1 day, got {window}")
+    if len(columns) == 0:
+        return []
+    if np is not None:
+        ordinals = np.asarray(columns.dates)
+        first = int(ordinals.min())
+        per_day = np.bincount(ordinals - first, weights=columns.minutes)
+        cumulative = np.concatenate(([0], np.cumsum(per_day)))
+        ends = np.arange(1, len(per_day) + 1)
+        sums = cumulative[ends] - cumulative[np.maximum(ends - window, 0)]
+        worked = np.nonzero(per_day)[0]
+        return [(first + int(i), int(sums[i])) for i in worked]
+    days = minutes_per_day(columns)
+    result = []
+    start = 0
+    running = 0
+    for ordinal, minutes in days:
+        running += minutes
+        while days[start][0] <= ordinal - window:
+            running -= days[start][1]
+            start += 1
+        if minutes:
+            result.append((ordinal, running))
+    return result
+
+
+def task_percentiles(
+    columns: WorklogColumns, percentiles: Sequence[int] = (50, 90)
+) -> Dict[str, List[int]]:
+    """Percentiles (linear interpolation) of single worklog duration in minutes per task"""
+    if len(columns) == 0:
+        return {}
+    if np is not None:
+        tasks = np.asarray(columns.tasks)
+        minutes = np.asarray(columns.minutes)
+        order = np.lexsort((minutes, tasks))
+        sorted_minutes = minutes[order]
+        counts = np.bincount(tasks, minlength=len(columns.task_names))
+        codes = np.nonzero(counts)[0]
+        starts = (np.cumsum(counts) - counts)[codes]
+        # one row per task, one column per percentile
+        # same operation order as _percentile, so both backends round alike
+        positions = np.outer(counts[codes] - 1, np.asarray(percentiles)) / 100
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.minimum(lower + 1, (counts[codes] - 1)[:, None])
+        fraction = positions - lower
+        low_values = sorted_minutes[starts[:, None] + lower]
+        high_values = sorted_minutes[starts[:, None] + upper]
+        values = low_values + (high_values - low_values) * fraction
+        return {
+            columns.task_names[code]: [int(round(x)) for x in row]
+            for code, row in zip(codes, values)
+        }
+    groups: Dict[int, List[int]] = {}
+    for code, minutes in zip(columns.tasks, columns.minutes):
+        groups.setdefault(code, []).append(minutes)
+    return {
+        columns.task_names[code]: [
+            int(round(_percentile(sorted(group), q))) for q in percentiles
+        ]
+        for code, group in sorted(groups.items())
+    }
+
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return (
+        sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+    )
+
+
+def overtime_days(
+    columns: WorklogColumns, limit: int = WORKDAY_MINUTES
+) -> List[Tuple[int, int]]:
+    """(date ordinal, minutes above limit) for every date where more than `limit` minutes were logged"""
+    return [
+        (day, total - limit) for day, total in minutes_per_day(columns) if total > limit
+    ]
+
+
+def format_stats(columns: WorklogColumns, top_tasks: int = TOP_TASKS) -> str:
+    skipped = f"Skipped {columns.skipped} worklogs with unknown date or duration"
+    if len(columns) == 0:
+        if columns.skipped:
+            return f"no worklogs selected\n{skipped}"
+        return "no worklogs selected"
+    lines = []
+    if columns.skipped:
+        lines.append(skipped)
+    lines.append("Weekdays")
+    for name, minutes in zip(WEEKDAYS, minutes_per_weekday(columns)):
+        if minutes:
+            lines.append(f"  {name} {format_minutes(minutes)}")
+    lines.append("Task total, p50 / p90")
+    totals = minutes_per_task(columns)
+    percentiles = task_percentiles(columns, (50, 90))
+    for task, total in totals[:top_tasks]:
+        p50, p90 = percentiles[task]
+        lines.append(
+            f"  {task} {format_minutes(total)}, {format_minutes(p50)} / {format_minutes(p90)}"
+        )
+    if len(totals) > top_tasks:
+        lines.append(f"  ... {len(totals) - top_tasks} more")
+    weekly = rolling_weekly_totals(columns)
+    if weekly:
+        busiest_day, busiest_total = max(weekly, key=lambda x: x[1])
+        lines.append(
+            f"Max 7 days  {format_minutes(busiest_total)} (to {date.fromordinal(busiest_day)})"
+        )
+    lines.append("Overtime")
+    overtime = overtime_days(columns)
+    for day, minutes in overtime:
+        lines.append(f"  {date.fromordinal(day)} +{format_minutes(minutes)}")
+    if not overtime:
+        lines.append("  none")
+    return "\n".join(lines)
@@ -17,15 +17,22 @@ from textual.widgets import (
     Input,
     Label,
     SelectionList,
+    Static,
 )
 from textual.widgets.selection_list import Selection
 
 from abstract.interfaces import Plugin, WorklogEntity, WorklogsRepository
+from lazy_worklog_tracker.analytics import (
+    columns_from_worklogs,
+    format_stats,
+    parse_duration,
+)
 
 MONTHS_VIEW = "months"
 DATES_VIEW = "dates"
 TASK_VIEW = "tasks"
 WORKLOG_VIEW = "worklogs"
+STATS_VIEW = "stats"
 
 
 Year = TypeVar("Year")
@@ -96,6 +103,7 @@ class NewWorklogScreen(Screen):
                     placeholder="2H30M",
                     classes="input-field",
                     id="duration-input",
+                    validators=[Function(validate_duration)],
                     value=self.duration_value,
                 )
                 yield self._duration
@@ -188,6 +196,11 @@ class WorklogScreen(Screen):
                     for col_name in plugin.columns():
                         self._worklogs.add_column(col_name)
                 yield self._worklogs
+            stats_container = containers.VerticalScroll(classes="stats-container")
+            stats_container.border_title = "Stats"
+            with stats_container:
+                self._stats = Static(id=STATS_VIEW)
+                yield self._stats
         yield Footer()
 
     def action_change_focus(self, widget_name: str) -> None:
@@ -199,6 +212,7 @@ class WorklogScreen(Screen):
         self._dates.clear_options()
         self._tasks.clear_options()
         self._worklogs.clear(False)
+        self._stats.update("")
         self.post_message(UpdateMonths())
 
     def if_options_empty(self, selection_list: SelectionList) -> None:
@@ -234,12 +248,22 @@ class WorklogScreen(Screen):
         worklogs.clear(False)
 
         worklogs_by_id = {
-            worklog.id: (worklog.date, worklog.task, worklog.duration)
+            worklog.id: worklog
             for worklog in self._repository.get_worklogs(dates.selected, tasks.selected)
+            if worklog.id is not None
         }
-        for id, row in worklogs_by_id.items():
-            if id is not None:
-                worklogs.add_row(*row, key=str(id))
+        for id, worklog in worklogs_by_id.items():
+            worklogs.add_row(worklog.date, worklog.task, worklog.duration, key=str(id))
+        self.update_stats()
+
+    def update_stats(self) -> None:
+        table = self._worklogs
+        shown = (
+            WorklogEntity(int(row_key.value), *table.get_row(row_key)[:3])
+            for row_key in table.rows
+            if row_key.value is not None
+        )
+        self._stats.update(format_stats(columns_from_worklogs(shown)))
 
     @work(exclusive=True)
     @on(UpdateTasks)
@@ -365,6 +389,7 @@ class WorklogScreen(Screen):
             if row_key.value is not None:
                 self._repository.delete(int(row_key.value))
                 table.remove_row(row_key)
+                self.update_stats()
 
 
 def validate_date(date_text):
@@ -374,3 +399,7 @@ def validate_date(date_text):
         return True
     except ValueError:
         return False
+
+
+def validate_duration(duration_text):
+    return parse_duration(duration_text) is not None
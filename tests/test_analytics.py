@@ -0,0 +1,239 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from abstract.interfaces import WorklogEntity
+from lazy_worklog_tracker import analytics
+
+numpy = analytics.np
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if numpy is None:
+            pytest.skip("numpy is not installed")
+        monkeypatch.setattr(analytics, "np", numpy)
+    else:
+        monkeypatch.setattr(analytics, "np", None)
+    return request.param
+
+
+def columns(*rows):
+    return analytics.columns_from_worklogs(
+        WorklogEntity(i, day, task, duration)
+        for i, (day, task, duration) in enumerate(rows)
+    )
+
+
+def ordinal(text):
+    return date.fromisoformat(text).toordinal()
+
+
+@pytest.mark.parametrize(
+    "text, minutes",
+    [
+        ("2H30M", 150),
+        ("3h", 180),
+        ("45m", 45),
+        (" 1H 5M ", 65),
+        ("0M", 0),
+        ("24H", 1440),
+        ("1440M", 1440),
+        ("24H1M", None),
+        ("1441M", None),
+        ("99999999999999999999H", None),
+        ("", None),
+        ("1.5h", None),
+        ("90", None),
+        ("2h 30min", None),
+    ],
+)
+def test_parse_duration(text, minutes):
+    assert analytics.parse_duration(text) == minutes
+
+
+@pytest.mark.parametrize("minutes", [0, 1, 45, 60, 61, 150, 600, 1439])
+def test_format_minutes_round_trip(minutes):
+    assert analytics.parse_duration(analytics.format_minutes(minutes)) == minutes
+
+
+def test_columns_skip_unparseable(backend):
+    data = columns(
+        ("2024-01-01", "a", "1H"),
+        ("2024-01-01", "a", "1.5h"),
+        ("bad", "a", "1H"),
+    )
+    assert len(data) == 1
+    assert data.skipped == 2
+    assert list(data.minutes) == [60]
+
+
+def test_columns_skip_invalid_types(backend):
+    data = columns(
+        ("2024-01-01", "a", "1H"),
+        (None, "a", "1H"),
+        ("2024-01-01", "a", None),
+        ("2024-01-01", "a", "99999999999999999999H"),
+    )
+    assert len(data) == 1
+    assert data.skipped == 3
+
+
+def test_minutes_per_weekday(backend):
+    # 2024-01-01 is a Monday
+    data = columns(
+        ("2024-01-01", "a", "1H"),
+        ("2024-01-08", "b", "30M"),
+        ("2024-01-07", "a", "2H"),
+    )
+    assert analytics.minutes_per_weekday(data) == [90, 0, 0, 0, 0, 0, 120]
+
+
+def test_minutes_per_task_most_logged_first(backend):
+    data = columns(
+        ("2024-01-01", "a", "1H"),
+        ("2024-01-01", "b", "3H"),
+        ("2024-01-02", "c", "1H"),
+        ("2024-01-02", "a", "1H"),
+    )
+    assert analytics.minutes_per_task(data) == [("b", 180), ("a", 120), ("c", 60)]
+
+
+def test_rolling_weekly_totals_window_boundary(backend):
+    data = columns(
+        ("2024-01-01", "a", "1H"),
+        ("2024-01-07", "a", "2H"),
+        ("2024-01-08", "a", "4H"),
+    )
+    # 2024-01-08 is exactly 7 days after 2024-01-01, so 2024-01-01 drops out
+    assert analytics.rolling_weekly_totals(data) == [
+        (ordinal("2024-01-01"), 60),
+        (ordinal("2024-01-07"), 180),
+        (ordinal("2024-01-08"), 360),
+    ]
+
+
+def test_rolling_weekly_totals_gap(backend):
+    data = columns(
+        ("2024-01-01", "a", "1H"),
+        ("2024-01-01", "b", "1H"),
+        ("2024-02-01", "a", "30M"),
+    )
+    assert analytics.rolling_weekly_totals(data) == [
+        (ordinal("2024-01-01"), 120),
+        (ordinal("2024-02-01"), 30),
+    ]
+
+
+def test_rolling_weekly_totals_skips_zero_days(backend):
+    data = columns(("2024-01-01", "a", "0M"), ("2024-01-02", "a", "1H"))
+    assert analytics.rolling_weekly_totals(data) == [(ordinal("2024-01-02"), 60)]
+
+
+@pytest.mark.parametrize("window", [0, -1])
+def test_rolling_weekly_totals_invalid_window(backend, window):
+    with pytest.raises(ValueError):
+        analytics.rolling_weekly_totals(columns(("2024-01-01", "a", "1H")), window)
+    with pytest.raises(ValueError):
+        analytics.rolling_weekly_totals(columns(), window)
+
+
+def test_task_percentiles(backend):
+    data = columns(
+        ("2024-01-01", "single", "45M"),
+        ("2024-01-01", "pair", "1H"),
+        ("2024-01-02", "pair", "2H"),
+        ("2024-01-01", "many", "4H"),
+        ("2024-01-02", "many", "1H"),
+        ("2024-01-03", "many", "2H"),
+        ("2024-01-04", "many", "3H"),
+    )
+    assert analytics.task_percentiles(data, (0, 50, 90, 100)) == {
+        "single": [45, 45, 45, 45],
+        "pair": [60, 90, 114, 120],
+        "many": [60, 150, 222, 240],
+    }
+
+
+def test_overtime_days(backend):
+    data = columns(
+        ("2024-01-01", "a", "6H"),
+        ("2024-01-01", "b", "3H"),
+        ("2024-01-02", "a", "8H"),
+    )
+    assert analytics.overtime_days(data) == [(ordinal("2024-01-01"), 60)]
+
+
+def test_format_stats_empty(backend):
+    assert analytics.format_stats(columns()) == "no worklogs selected"
+
+
+def test_format_stats_only_unparseable(backend):
+    stats = analytics.format_stats(columns(("2024-01-01", "a", "1.5h")))
+    assert stats.startswith("no worklogs selected")
+    assert "Skipped 1 worklogs" in stats
+
+
+def test_format_stats_all_zero(backend):
+    stats = analytics.format_stats(
+        columns(("2024-01-01", "a", "0M"), ("2024-01-02", "b", "0M"))
+    )
+    assert "Max 7 days" not in stats
+    assert "Overtime\n  none" in stats
+
+
+def test_format_stats_limits_tasks(backend):
+    rows = [("2024-01-01", f"task-{i}", f"{i + 1}M") for i in range(15)]
+    stats = analytics.format_stats(columns(*rows), top_tasks=3)
+    assert "task-14 15M" in stats
+    assert "task-11 12M" not in stats
+    assert "... 12 more" in stats
+
+
+def random_worklogs(rows):
+    rnd = random.Random(7)
+    start = date(2024, 1, 1)
+    return [
+        WorklogEntity(
+            i,
+            (start + timedelta(days=rnd.randrange(60))).isoformat(),
+            f"task-{rnd.randrange(12)}",
+            analytics.format_minutes(rnd.randrange(0, 600, 5)),
+        )
+        for i in range(rows)
+    ]
+
+
+def raised(func, *args):
+    try:
+        func(*args)
+    except Exception as e:
+        return type(e)
+    return None
+
+
+def run_all(worklogs):
+    data = analytics.columns_from_worklogs(worklogs)
+    return (
+        raised(analytics.rolling_weekly_totals, data, 0),
+        analytics.minutes_per_weekday(data),
+        analytics.minutes_per_day(data),
+        analytics.minutes_per_task(data),
+        analytics.rolling_weekly_totals(data),
+        analytics.rolling_weekly_totals(data, window=3),
+        analytics.task_percentiles(data, (10, 50, 90)),
+        analytics.overtime_days(data),
+        analytics.format_stats(data),
+    )
+
+
+def test_backends_agree(monkeypatch):
+    if numpy is None:
+        pytest.skip("numpy is not installed")
+    worklogs = random_worklogs(2000)
+    monkeypatch.setattr(analytics, "np", numpy)
+    with_numpy = run_all(worklogs)
+    monkeypatch.setattr(analytics, "np", None)
+    assert run_all(worklogs) == with_numpy